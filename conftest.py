@@ -0,0 +1 @@
+# Makes the `detection` package importable when pytest is run from the repository root.
@@ -1,19 +1,19 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from functools import total_ordering
-from math import sqrt
-from typing import List, Dict, Type, Set
+from operator import attrgetter
+from reprlib import recursive_repr
+from typing import List, Dict, Type, Set, Tuple
 
 from detection.definitions import node_translation_dict
-from detection.thresholds import skip_attr_list_threshold
-from detection.utils import calculate_score_based_on_numbers
+from detection.utils import calculate_score_based_on_numbers, lengths_too_different
 
 
-@total_ordering
 class Report:
     """Pairwise comparison result. Creates a tree of bijective matches."""
 
+    __slots__ = ("probability", "weight", "first", "second", "child_reports")
+
     def __init__(
         self,
         probability: int,
@@ -27,6 +27,7 @@ class Report:
         self.second: ComparableEntity = second
         self.child_reports: List[Report] = []
 
+    # Reports are ordered by probability first and by weight second.
     def __lt__(self, other: Report):
         return (
             self.probability < other.probability
@@ -34,9 +35,32 @@ class Report:
             else self.weight < other.weight
         )
 
+    def __le__(self, other: Report):
+        return (
+            self.probability < other.probability
+            if self.probability != other.probability
+            else self.weight <= other.weight
+        )
+
+    def __gt__(self, other: Report):
+        return (
+            self.probability > other.probability
+            if self.probability != other.probability
+            else self.weight > other.weight
+        )
+
+    def __ge__(self, other: Report):
+        return (
+            self.probability > other.probability
+            if self.probability != other.probability
+            else self.weight >= other.weight
+        )
+
     def __eq__(self, other: Report):
         return self.probability == other.probability and self.weight == other.weight
 
+    __hash__ = None
+
     def __repr__(self):
         return (
             f"< Report, probability: {self.probability}, comparing entities: {self.first.name}, "
@@ -44,37 +68,49 @@ class Report:
         )
 
     def __add__(self, other: Report):
+        report = Report(self.probability, self.weight, self.first, self.second)
+        report.child_reports.extend(self.child_reports)
+        report += other
+        return report
+
+    def __iadd__(self, other: Report):
+        """Accumulate `other` in place."""
         weight = self.weight + other.weight
-        if weight == 0:
-            weight = 1
-        report = Report(
-            (self.probability * self.weight + other.probability * other.weight)
-            // weight,
-            (self.weight + other.weight),
-            self.first,
-            self.second,
-        )
+        self.probability = (
+            self.probability * self.weight + other.probability * other.weight
+        ) // (weight if weight else 1)
+        self.weight = weight
         if isinstance(self.first, type(other.first)) or isinstance(
             self.second, type(other.second)
         ):
-            report.child_reports.extend(self.child_reports)
-            report.child_reports.extend(other.child_reports)
-        else:
-            report.child_reports.extend(self.child_reports)
-            if other.first.visualise or other.second.visualise:
-                report.child_reports.append(other)
-        return report
+            self.child_reports.extend(other.child_reports)
+        elif other.first.visualise or other.second.visualise:
+            self.child_reports.append(other)
+        return self
+
+
+_match_order = attrgetter("probability", "weight")
 
 
 class ComparableEntity(ABC):
     """Abstract object class for all the comparable parts of projects."""
 
+    __slots__ = ("name", "visualise")
+
     def __init__(self):
         self.name: str = ""
         self.visualise: bool = False
 
+    @recursive_repr()
     def __repr__(self):
-        return f"<{self.__class__.__name__}: {self.__dict__}>"
+        attributes = {
+            slot: getattr(self, slot)
+            for cls in reversed(type(self).__mro__)
+            for slot in vars(cls).get("__slots__", ())
+            if hasattr(self, slot)
+        }
+        attributes.update(getattr(self, "__dict__", {}))
+        return f"<{self.__class__.__name__}: {attributes}>"
 
     @abstractmethod
     def compare(self, other: ComparableEntity, fast_scan: bool = False) -> Report:
@@ -98,36 +134,31 @@ class ComparableEntity(ABC):
         if isinstance(self_attr_val, List):
             if not self_attr_val or not other_attr_val:
                 return Report(0, 0, self, other)
-            if fast_scan and (
-                1
-                - sqrt(
-                    abs(len(self_attr_val) - len(other_attr_val))
-                    / (len(self_attr_val) + len(other_attr_val))
-                )
-                < skip_attr_list_threshold
+            if fast_scan and lengths_too_different(
+                len(self_attr_val), len(other_attr_val)
             ):
                 return Report(0, 10, self, other)
-            matrix = []
-            self_unused_vals = set(self_attr_val)
-            other_unused_vals = set(other_attr_val)
-            for self_val in self_attr_val:
-                matrix.extend(
-                    self_val.compare(other_val, fast_scan)
-                    for other_val in other_attr_val
-                )
-            while matrix:
-                max_report = max(matrix)
-                self_unused_vals.remove(max_report.first)
-                other_unused_vals.remove(max_report.second)
-                matrix = list(
-                    filter(
-                        lambda x: False
-                        if max_report.second == x.second or max_report.first == x.first
-                        else True,
-                        matrix,
-                    )
-                )
-                report += max_report
+            matrix = [
+                self_val.compare(other_val, fast_scan)
+                for self_val in self_attr_val
+                for other_val in other_attr_val
+            ]
+            # Ordered sets of the parts not matched yet.
+            self_unused_vals = dict.fromkeys(self_attr_val)
+            other_unused_vals = dict.fromkeys(other_attr_val)
+            # Most similar pairs are matched first.
+            matrix.sort(key=_match_order, reverse=True)
+            for candidate in matrix:
+                if (
+                    candidate.first in self_unused_vals
+                    and candidate.second in other_unused_vals
+                ):
+                    del self_unused_vals[candidate.first]
+                    del other_unused_vals[candidate.second]
+                    report += candidate
+                    # Nothing else can be matched.
+                    if not self_unused_vals or not other_unused_vals:
+                        break
             for unused in self_unused_vals:
                 report += Report(0, 10, unused, not_found)
             for unused in other_unused_vals:
@@ -154,104 +185,96 @@ class AbstractProject(ComparableEntity, ABC):
         """Returns the size of the project."""
         pass
 
+    @abstractmethod
+    def clear_comparison_caches(self):
+        """Forget memoized comparison results."""
+        pass
+
 
 class AbstractStatementBlock(ComparableEntity, ABC):
     """Abstract statement block. Made abstract in order not to repeat code for each project type."""
 
     def compare(self, other: AbstractStatementBlock, fast_scan: bool = False) -> Report:
-        report = Report(0, 0, self, other)
+        cached = self._cmp_cache.get(other)
+        if cached is not None:
+            return Report(*cached, self, other)
+        probability = 0
+        weight = 0
         max_score = 100
         all_node_types = set(self.parts.keys())
         all_node_types.update(other.parts.keys())
+        get_fallback_type = node_translation_dict.get
+        get_self_occurrences = self.parts.get
+        get_other_occurrences = other.parts.get
         for node_type in all_node_types:
-            fallback_type = node_translation_dict.get(node_type, None)
-            self_occurrences = self.parts.get(node_type, 0)
+            fallback_type = get_fallback_type(node_type, None)
+            self_occurrences = get_self_occurrences(node_type, 0)
             if self_occurrences == 0:
                 max_score -= 25
-                self_occurrences = self.parts.get(fallback_type, 0)
-            other_occurrences = other.parts.get(node_type, 0)
+                self_occurrences = get_self_occurrences(fallback_type, 0)
+            other_occurrences = get_other_occurrences(node_type, 0)
             if other_occurrences == 0:
                 max_score -= 25
-                other_occurrences = other.parts.get(fallback_type, 0)
-            report += Report(
+                other_occurrences = get_other_occurrences(fallback_type, 0)
+            score = (
                 calculate_score_based_on_numbers(self_occurrences, other_occurrences)
                 * max_score
-                // 100,
-                10,
-                self,
-                other,
+                // 100
             )
-        return report
+            # Same as adding `Report(score, 10, self, other)`.
+            probability = (probability * weight + score * 10) // (weight + 10)
+            weight += 10
+        self._cmp_cache.update({other: (probability, weight)})
+        return Report(probability, weight, self, other)
 
-    def __init__(self, statement, realm: Type):
+    def __init__(self, statement, realm: Type, block_types: Set[Type] = frozenset()):
         """Parameter `statement` requires the AST object,
         `realm` is a type that the nodes of the AST should be an instance of.
-         (To check which parts of the AST defines node types, is used for navigating in the tree structure.)"""
+         (To check which parts of the AST defines node types, is used for navigating in the tree structure.)
+        `block_types` are node types whose subtrees are collected in `searched_nodes`."""
         super().__init__()
         self.statement = statement
         self.realm = realm
-        self.parts: Dict[Type, int] = self._tree_to_dict(statement)
-
-    def _tree_to_dict(self, node) -> dict[Type, int]:
-        """Method that transforms the AST node to a dictionary of node types and their counts."""
-        ans: Dict[Type, int] = {}
-        node_type = type(node)
-        if node_type in ans.keys():
-            ans.update({node_type: ans.get(node_type) + 1})
-        else:
-            ans.update({node_type: 1})
-        attrs = [a for a in dir(node) if not a.startswith("_")]
-        for attribute in attrs:
-            child = getattr(node, attribute, None)
-            if not isinstance(child, self.realm):
-                continue
-            child_dict = self._tree_to_dict(child)
-            for key in child_dict:
-                if key in ans.keys():
-                    ans.update({key: ans[key] + child_dict[key]})
-                else:
-                    ans.update({key: child_dict[key]})
-        return ans
+        self.parts: Dict[Type, int]
+        self.searched_nodes: Dict[Type, List]
+        self.parts, self.searched_nodes = self._walk_tree(statement, block_types)
+        self._cmp_cache: Dict[AbstractStatementBlock, Tuple[int, int]] = {}
 
-    def _search_for_types(self, statement, block_types: Set[Type]) -> Dict[Type, List]:
-        """Go through AST and fetch subtrees rooted in specified node types.
-        Parameter `statement` represents AST, `block_types` is set of searched node types.
-        Returns dictionary structured as so: `{NodeType1: [subtree1, subtree2, ...], NodeType2: [...]}`"""
-        ans = {}
-        if not isinstance(statement, self.realm):
-            return ans
-        node_type = type(statement)
-        if node_type in block_types:
-            if node_type in ans.keys():
-                ans.update(
-                    {
-                        node_type: ans[node_type]
-                        + [
-                            statement,
-                        ]
-                    }
-                )
-            else:
-                ans.update(
-                    {
-                        node_type: [
-                            statement,
-                        ]
-                    }
-                )
-        for attribute in filter(
-            lambda x: False if x.startswith("_") else True, dir(statement)
-        ):
-            child = getattr(statement, attribute, None)
+    def clear_comparison_cache(self):
+        """Forget memoized comparisons with other blocks."""
+        self._cmp_cache.clear()
+
+    def _child_nodes(self, node) -> List:
+        """Children of the AST node that belong to the realm."""
+        ans = []
+        for attribute in dir(node):
+            if attribute.startswith("_"):
+                continue
+            child = getattr(node, attribute, None)
             if isinstance(child, self.realm):
-                dict_to_add = self._search_for_types(child, block_types)
-                for key in dict_to_add:
-                    if key in ans.keys():
-                        ans.update({key: ans[key] + dict_to_add[key]})
-                    else:
-                        ans.update({key: dict_to_add[key]})
+                ans.append(child)
         return ans
 
+    def _walk_tree(
+        self, node, block_types: Set[Type]
+    ) -> Tuple[Dict[Type, int], Dict[Type, List]]:
+        """Count node types of the AST and fetch subtrees rooted in `block_types`.
+        Returns dictionary of node types and their counts
+        and dictionary structured as so: `{NodeType1: [subtree1, subtree2, ...], NodeType2: [...]}`."""
+        parts: Dict[Type, int] = {}
+        searched_nodes: Dict[Type, List] = {}
+        if not isinstance(node, self.realm):
+            block_types = frozenset()
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            node_type = type(node)
+            parts[node_type] = parts.get(node_type, 0) + 1
+            if node_type in block_types:
+                searched_nodes.setdefault(node_type, []).append(node)
+            stack.extend(reversed(self._child_nodes(node)))
+        return parts, searched_nodes
+
 
 class NotFound(ComparableEntity):
     """Indicate that some part of the projects could not be matched to anything."""
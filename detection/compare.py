@@ -144,12 +144,9 @@ class ExcelHandler:
         max_name_length = max([len(n) for n in dict_of_projects.keys()])
         for project_name in project_names:
             best_match = max(
-                filter(
-                    lambda x: True
-                    if x.first.name == project_name or x.second.name == project_name
-                    else False,
-                    reports,
-                )
+                r
+                for r in reports
+                if r.first.name == project_name or r.second.name == project_name
             )
             row = dict_of_projects[project_name] - no_of_templates
             if row > 0:
@@ -26,6 +26,20 @@ type_translation_dict = {
     "IntegerProperty": "DoubleProperty",
     "LongProperty": "DoubleProperty",
 }
+java_modifier_ids = {
+    "public": 0,
+    "protected": 1,
+    "private": 2,
+    "static": 3,
+    "abstract": 4,
+    "final": 5,
+    "native": 6,
+    "synchronized": 7,
+    "transient": 8,
+    "volatile": 9,
+    "strictfp": 10,
+    "default": 11,
+}
 node_translation_dict = {
     javalang.tree.WhileStatement: javalang.tree.ForStatement,
     javalang.tree.SwitchStatementCase: javalang.tree.IfStatement,
@@ -37,6 +51,7 @@ node_translation_dict = {
 projects_dir = "projects"
 templates_dir = "templates"
 env_file = ".env"
+java_ast_cache_dir = ".java_ast_cache"
 project_regex = r".*proj.*3"
 cpu_count = cpu_count() - 1
 number_of_tries_to_clone = 3
@@ -1,35 +1,45 @@
 from __future__ import annotations
 
 import pathlib
+import sys
 from functools import cached_property
 
 import javalang
 import javalang.tree
-from typing import List, Union, Set, Optional, Dict
-import re
+from typing import Callable, List, Union, Set, Optional, Dict, Tuple
 
 from detection.abstract_scan import (
     Report,
     ComparableEntity,
     AbstractStatementBlock,
     AbstractProject,
+    not_found,
 )
-from detection.definitions import type_translation_dict
+from detection.definitions import type_translation_dict, java_modifier_ids
 from detection.thresholds import method_interface_threshold
 from detection.utils import (
     get_java_ast,
     get_user_project_root,
     get_java_files,
+    lengths_too_different,
+    calculate_score_of_exact_matches,
 )
 
 
+# Zero report of unrelated types, only its weight is used.
+_unrelated_types = Report(0, 10, not_found, not_found)
+
+
 class JavaModifier(ComparableEntity):
     """Modifiers of classes, methods or variables."""
 
+    __slots__ = ("name_id",)
+
     def __init__(self, name: str):
         """Parameter `name` represents the Modifier string."""
         super().__init__()
-        self.name: str = name
+        self.name: str = sys.intern(name)
+        self.name_id: int = java_modifier_ids[self.name]
 
     def compare(self, other: JavaModifier, fast_scan: bool = False) -> Report:
         if self.name == other.name:
@@ -53,13 +63,30 @@ class JavaType(ComparableEntity):
          and `project` keeps track of the parent `Project` object."""
         super().__init__()
         self.project = project
-        self.name: str = type_name
-        self.package: str = package
+        self.name: str = sys.intern(type_name) if type_name else type_name
+        self.package: str = sys.intern(package) if package else package
+        self._hash: int = hash((self.name, self.package))
         if not type_name:
             self.compatible_format = None
             return
         self.compatible_format: str = type_translation_dict.get(self.name)
 
+    @classmethod
+    def get(
+        cls,
+        type_name: Union[str, None],
+        package: Union[str, None],
+        project: JavaProject,
+    ) -> JavaType:
+        """Return the shared `JavaType` object of the type, create it on first use.
+        Parameters are the same as for the constructor."""
+        key = (type_name, package)
+        java_type = project.type_pool.get(key)
+        if java_type is None:
+            java_type = cls(type_name, package, project)
+            project.type_pool.update({key: java_type})
+        return java_type
+
     @cached_property
     def is_user_defined(self) -> bool:
         """Was this data type declared by the programmer or not?"""
@@ -70,6 +97,35 @@ class JavaType(ComparableEntity):
         """Lists basic and externally imported data types that composed user-defined data type."""
         return self.project.user_types.get(self)
 
+    @cached_property
+    def composition(self) -> Tuple[Tuple[Tuple[int, str], ...], int]:
+        """Signature of the distinct non-user-defined parts and the weight of their self-comparison."""
+        parts = dict.fromkeys(self.non_user_defined_types)
+        signature = tuple(
+            sorted((variable.modifier_mask, variable.type.name) for variable in parts)
+        )
+        weight = sum(
+            10 * len(variable.modifiers) + (10 if variable.type.name else 1)
+            for variable in parts
+        )
+        return signature, weight
+
+    def quick_zero(self, other: JavaType) -> bool:
+        """Cheap check that `compare` would find no similarity."""
+        if not self.name and not other.name:
+            return False
+        if self.is_user_defined != other.is_user_defined:
+            return True
+        if self.is_user_defined or self.name == other.name:
+            return False
+        if self.compatible_format is None and other.compatible_format is None:
+            return True
+        return (
+            self.compatible_format != other.name
+            and self.name != other.compatible_format
+            and self.compatible_format != other.compatible_format
+        )
+
     def compare(self, other: JavaType, fast_scan: bool = False) -> Report:
         if not self.name and not other.name:
             return Report(100, 1, self, other)
@@ -88,20 +144,40 @@ class JavaType(ComparableEntity):
             ):
                 return Report(50, 10, self, other)
         else:
-            report = self.compare_parts(other, "non_user_defined_types", fast_scan)
-            return report
+            # Raw lengths for the fast scan check, cyclic types repeat their parts.
+            signature, weight = self.composition
+            if (
+                signature
+                and signature == other.composition[0]
+                and not (
+                    fast_scan
+                    and lengths_too_different(
+                        len(self.non_user_defined_types),
+                        len(other.non_user_defined_types),
+                    )
+                )
+            ):
+                return Report(100, weight, self, other)
+            return self.project.cached_comparison(
+                self,
+                other,
+                fast_scan,
+                lambda: self.compare_parts(other, "non_user_defined_types", fast_scan),
+            )
         return Report(0, 10, self, other)
 
     def __eq__(self, other: JavaType):
         return self.name == other.name and self.package == other.package
 
     def __hash__(self):
-        return self.name.__hash__() + self.package.__hash__()
+        return self._hash
 
 
 class JavaVariable(ComparableEntity):
     """Holds reference to a variable from the source code."""
 
+    __slots__ = ("java_file", "modifiers", "modifier_mask", "type_name", "_type")
+
     def __init__(
         self,
         variable_declaration: Union[
@@ -116,26 +192,67 @@ class JavaVariable(ComparableEntity):
          That is why 2 subtrees are required in order to construct this object.)"""
         super().__init__()
         self.java_file: JavaFile = java_file
-        self.name: str = variable_declarator.name
+        self.name: str = sys.intern(variable_declarator.name)
         self.modifiers: List[JavaModifier] = [
             JavaModifier(m) for m in variable_declaration.modifiers
         ]
+        self.modifier_mask: int = 0
+        for modifier in self.modifiers:
+            self.modifier_mask |= 1 << modifier.name_id
         self.type_name: str = variable_declaration.type.name
+        self._type: Optional[JavaType] = None
 
-    @cached_property
+    @property
     def type(self) -> JavaType:
-        """Returns `JavaType` instance."""
-        return self.java_file.get_type(self.type_name)
+        """Returns `JavaType` instance, resolved on first access."""
+        if self._type is None:
+            self._type = self.java_file.get_type(self.type_name)
+        return self._type
+
+    def compare_modifiers(self, other: JavaVariable, fast_scan: bool = False) -> Report:
+        """Same result as `compare_parts(other, "modifiers", fast_scan)`, from the modifier masks."""
+        self_len = len(self.modifiers)
+        other_len = len(other.modifiers)
+        if not self_len or not other_len:
+            return Report(0, 0, self, other)
+        if fast_scan and lengths_too_different(self_len, other_len):
+            return Report(0, 10, self, other)
+        matches = bin(self.modifier_mask & other.modifier_mask).count("1")
+        return Report(
+            calculate_score_of_exact_matches(
+                matches, max(self_len, other_len) - matches
+            ),
+            10 * max(self_len, other_len),
+            self,
+            other,
+        )
 
     def compare(self, other: JavaVariable, fast_scan: bool = False) -> Report:
-        report = self.compare_parts(other, "modifiers", fast_scan)
-        report += self.compare_parts(other, "type", fast_scan)
+        return self.java_file.project.cached_comparison(
+            self, other, fast_scan, lambda: self._compare(other, fast_scan)
+        )
+
+    def _compare(self, other: JavaVariable, fast_scan: bool) -> Report:
+        # Same result as `compare_parts(other, "type", fast_scan)` without the wrapping report.
+        report = self.compare_modifiers(other, fast_scan)
+        if self.type.quick_zero(other.type):
+            report += _unrelated_types
+        else:
+            report += self.type.compare(other.type, fast_scan)
         return report
 
 
 class JavaMethodInvocation:
     """Helper class, represents invoked method from the body of another method."""
 
+    __slots__ = (
+        "statement",
+        "qualifier_str",
+        "name",
+        "_qualifier",
+        "_method_referenced",
+    )
+
     def __init__(
         self,
         method_invocation: javalang.tree.MethodInvocation,
@@ -146,10 +263,18 @@ class JavaMethodInvocation:
         self.statement: JavaStatementBlock = statement
         self.qualifier_str: str = method_invocation.qualifier
         self.name: str = method_invocation.member
+        # `_qualifier` and `_method_referenced` are set once resolved.
 
-    @cached_property
+    @property
     def qualifier(self) -> Optional[JavaVariable]:
         """Java variable upon which the method was called."""
+        try:
+            return self._qualifier
+        except AttributeError:
+            self._qualifier = self._find_qualifier()
+            return self._qualifier
+
+    def _find_qualifier(self) -> Optional[JavaVariable]:
         if self.qualifier_str:
             qualifier = self.statement.java_method.get_local_variable(
                 self.qualifier_str
@@ -162,37 +287,36 @@ class JavaMethodInvocation:
         else:
             return None
 
-    @cached_property
+    @property
     def method_referenced(self) -> Optional[JavaMethod]:
         """`JavaMethod` object of the method that was called."""
+        try:
+            return self._method_referenced
+        except AttributeError:
+            self._method_referenced = self._find_method_referenced()
+            return self._method_referenced
+
+    def resolve(self):
+        """Find the qualifier and the referenced method."""
+        self._qualifier = self._find_qualifier()
+        self._method_referenced = self._find_method_referenced()
+
+    def _find_method_referenced(self) -> Optional[JavaMethod]:
         qualifier = self.qualifier
         if not qualifier:
-            local_methods = list(
-                filter(
-                    lambda x: True if self.name == x.name else False,
-                    self.statement.java_method.java_class.methods,
-                )
+            local_methods = self.statement.java_method.java_class.methods_by_name.get(
+                self.name, []
             )
             if len(local_methods) == 1:
                 return local_methods[0]
         else:
             t = qualifier.type
             if t.is_user_defined:
-                cls = list(
-                    filter(
-                        lambda x: True if x.name == t.name else False,
-                        self.statement.java_method.java_class.java_file.project.get_classes_in_package(
-                            t.package
-                        ),
-                    )
-                )
+                project = self.statement.java_method.java_class.java_file.project
+                cls = project.classes_by_package_and_name.get((t.package, t.name), [])
                 if len(cls) != 1:
                     return None
-                m = list(
-                    filter(
-                        lambda x: True if x.name == self.name else False, cls[0].methods
-                    )
-                )
+                m = cls[0].methods_by_name.get(self.name, [])
                 if len(m) != 1:
                     return None
                 return m[0]
@@ -204,15 +328,17 @@ class JavaStatementBlock(AbstractStatementBlock):
     def __init__(self, statement: javalang.tree.Statement, java_method: JavaMethod):
         """Parameter `statement` requires appropriate AST subtree,
         `java_method` holds reference to parent `JavaMethod` object."""
-        super().__init__(statement, javalang.tree.Statement)
-        self.name: str = f"Statement {statement.position}"
-        self.java_method: JavaMethod = java_method
-        self.local_variables: List[JavaVariable] = []
-        searched_nodes = self._search_for_types(
+        super().__init__(
             statement,
+            javalang.tree.Statement,
             {javalang.tree.VariableDeclaration, javalang.tree.MethodInvocation},
         )
-        for declaration in searched_nodes.get(javalang.tree.VariableDeclaration, []):
+        self.name: str = f"Statement {statement.position}"
+        self.java_method: JavaMethod = java_method
+        self.local_variables: List[JavaVariable] = []
+        for declaration in self.searched_nodes.get(
+            javalang.tree.VariableDeclaration, []
+        ):
             for declarator in declaration.declarators:
                 var = JavaVariable(
                     declaration, declarator, self.java_method.java_class.java_file
@@ -221,7 +347,7 @@ class JavaStatementBlock(AbstractStatementBlock):
 
         self.invoked_methods: List[JavaMethodInvocation] = [
             JavaMethodInvocation(m, self)
-            for m in searched_nodes.get(javalang.tree.MethodInvocation, [])
+            for m in self.searched_nodes.get(javalang.tree.MethodInvocation, [])
         ]
 
     @cached_property
@@ -240,6 +366,8 @@ class JavaStatementBlock(AbstractStatementBlock):
 class JavaParameter(ComparableEntity):
     """Arguments of methods."""
 
+    __slots__ = ("type_string", "method", "_type")
+
     def __init__(self, parameter_name: str, parameter_type: str, method: JavaMethod):
         """Parameter `parameter_name` represents the identifier for the argument,
         `parameter_type` is an identifier of the parameter type,
@@ -248,13 +376,18 @@ class JavaParameter(ComparableEntity):
         self.name: str = parameter_name
         self.type_string: str = parameter_type
         self.method: JavaMethod = method
+        self._type: Optional[JavaType] = None
 
-    @cached_property
-    def type(self):
-        """`JavaType` of the parameter."""
-        return self.method.java_class.java_file.get_type(self.type_string)
+    @property
+    def type(self) -> JavaType:
+        """`JavaType` of the parameter, resolved on first access."""
+        if self._type is None:
+            self._type = self.method.java_class.java_file.get_type(self.type_string)
+        return self._type
 
     def compare(self, other: JavaParameter, fast_scan: bool = False) -> Report:
+        if self.type.quick_zero(other.type):
+            return Report(0, 10, self, other)
         return self.compare_parts(other, "type", fast_scan)
 
 
@@ -267,7 +400,7 @@ class JavaMethod(ComparableEntity):
         """Parameter `java_method` requires appropriate AST subtree,
         `java_class` is reference to the parent `JavaClass` object."""
         super().__init__()
-        self.name: str = java_method.name
+        self.name: str = sys.intern(java_method.name)
         self.visualise = True
         self.java_class: JavaClass = java_class
         self.raw_statement_blocks: List[javalang.tree.Node] = java_method.body
@@ -300,16 +433,14 @@ class JavaMethod(ComparableEntity):
         """`JavaType` object of the return type."""
         return self.java_class.java_file.get_type(self.return_type_str)
 
+    @cached_property
+    def local_variables_by_name(self) -> Dict[str, JavaVariable]:
+        """Local variables by their names, the last declaration of a name wins."""
+        return {variable.name: variable for variable in self.local_variables}
+
     def get_local_variable(self, var_name: str) -> Optional[JavaVariable]:
         """Get local variable by its name."""
-        ans = list(
-            filter(
-                lambda x: True if x.name == var_name else False, self.local_variables
-            )
-        )
-        if len(ans) > 0:
-            return ans[-1]
-        return None
+        return self.local_variables_by_name.get(var_name)
 
     @cached_property
     def statements_from_invocations(self) -> List[JavaStatementBlock]:
@@ -324,8 +455,17 @@ class JavaMethod(ComparableEntity):
         """Statements from own body and from invoked methods."""
         return self.statement_blocks + self.statements_from_invocations
 
+    def resolve_invocations(self):
+        """Resolve the methods invoked from the body of this method."""
+        for block in self.statement_blocks:
+            for invocation in block.invoked_methods:
+                invocation.resolve()
+
     def compare(self, other: JavaMethod, fast_scan: bool = False) -> Report:
-        report = self.compare_parts(other, "return_type", fast_scan)
+        if self.return_type.quick_zero(other.return_type):
+            report = Report(0, 10, self, other)
+        else:
+            report = self.compare_parts(other, "return_type", fast_scan)
         report += self.compare_parts(other, "arguments", fast_scan)
         if (not fast_scan) or report.probability > method_interface_threshold:
             report += self.compare_parts(other, "all_blocks", fast_scan)
@@ -335,6 +475,16 @@ class JavaMethod(ComparableEntity):
 class JavaClass(ComparableEntity):
     """Representation of classes from the source code."""
 
+    __slots__ = (
+        "java_file",
+        "methods",
+        "variables",
+        "_nud_cache",
+        "modifiers",
+        "variables_by_name",
+        "methods_by_name",
+    )
+
     def __init__(
         self,
         java_class: javalang.tree.ClassDeclaration,
@@ -346,10 +496,11 @@ class JavaClass(ComparableEntity):
         `java_file` is reference to the parent `JavaFile` object."""
         super().__init__()
         self.java_file: JavaFile = java_file
-        self.name: str = java_class.name
+        self.name: str = sys.intern(java_class.name)
         self.visualise = True
         self.methods: List[JavaMethod] = []
         self.variables: List[JavaVariable] = []
+        self._nud_cache: Optional[List[JavaType]] = None
         self.modifiers: List[JavaModifier] = [
             JavaModifier(m) for m in java_class.modifiers
         ]
@@ -357,18 +508,26 @@ class JavaClass(ComparableEntity):
             for declarator in field.declarators:
                 if isinstance(declarator, javalang.tree.VariableDeclarator):
                     variable = JavaVariable(field, declarator, self.java_file)
-                    variable.modifiers = [JavaModifier(m) for m in field.modifiers]
                     self.variables.append(variable)
         for method in java_class.methods:
             if method.body and len(method.body) >= min_body_len:
                 self.methods.append(JavaMethod(method, self))
+        # The last declaration of a variable name wins, methods can be overloaded.
+        self.variables_by_name: Dict[str, JavaVariable] = {
+            variable.name: variable for variable in self.variables
+        }
+        self.methods_by_name: Dict[str, List[JavaMethod]] = {}
+        for method in self.methods:
+            self.methods_by_name.setdefault(method.name, []).append(method)
 
     def get_non_user_defined_types(
         self, skip: Optional[Set[JavaType]] = None
     ) -> List[JavaType]:
         """Return all class attribute types as list of types not defined by the user."""
         if skip is None:
-            skip = set()
+            if self._nud_cache is None:
+                self._nud_cache = self.get_non_user_defined_types(set())
+            return self._nud_cache
         ans = []
         for variable in self.variables:
             if not variable.type.is_user_defined:
@@ -388,12 +547,7 @@ class JavaClass(ComparableEntity):
 
     def get_variable(self, var_name: str):
         """Find variable by its name."""
-        ans = list(
-            filter(lambda x: True if x.name == var_name else False, self.variables)
-        )
-        if len(ans) > 0:
-            return ans[-1]
-        return None
+        return self.variables_by_name.get(var_name)
 
     def compare(self, other: JavaClass, fast_scan: bool = False) -> Report:
         report = self.compare_parts(other, "variables", fast_scan)
@@ -404,11 +558,31 @@ class JavaClass(ComparableEntity):
 class JavaFile(ComparableEntity):
     """Represents files that end with the '.java' extension."""
 
+    __slots__ = (
+        "path",
+        "name_without_appendix",
+        "project",
+        "package",
+        "wildcard_imports",
+        "imports",
+        "import_types",
+        "import_map",
+        "wildcard_import_map",
+        "classes",
+        "_type_cache",
+    )
+
     def __init__(
-        self, path: Union[str, pathlib.Path], project: JavaProject, *, min_body_len=0
+        self,
+        path: Union[str, pathlib.Path],
+        project: JavaProject,
+        *,
+        min_body_len=0,
+        compilation_unit: Optional[javalang.tree.CompilationUnit] = None,
     ):
         """Parameter `path` is path to the file,
-        `project` is parent `Project` instance."""
+        `project` is parent `Project` instance,
+        `compilation_unit` is an optional already parsed AST of the file."""
         super().__init__()
         self.path: pathlib.Path = (
             pathlib.Path(path) if not isinstance(path, pathlib.Path) else path
@@ -416,47 +590,63 @@ class JavaFile(ComparableEntity):
         self.name: str = self.path.name
         self.visualise = True
         self.name_without_appendix: str = self.name.replace(".java", "")
-        compilation_unit = get_java_ast(path)
+        if compilation_unit is None:
+            compilation_unit = get_java_ast(path)
         if not compilation_unit:
             raise ValueError(f"Invalid Java file, compilation failed: {path}")
         self.project: JavaProject = project
-        self.package: str = getattr(compilation_unit.package, "name", "")
-        self.wildcard_imports = [i.path for i in compilation_unit.imports if i.wildcard]
+        self.package: str = sys.intern(getattr(compilation_unit.package, "name", ""))
+        self.wildcard_imports = [
+            sys.intern(i.path) for i in compilation_unit.imports if i.wildcard
+        ]
         self.imports: List[str] = [
-            i.path for i in compilation_unit.imports if not i.wildcard
+            sys.intern(i.path) for i in compilation_unit.imports if not i.wildcard
         ]
         self.import_types: List[str] = [i.split(".")[-1] for i in self.imports]
+        self.import_map: Dict[str, str] = {}
+        # Class names provided by wildcard imports, filled by the project.
+        self.wildcard_import_map: Dict[str, str] = {}
+        self._type_cache: Dict[str, JavaType] = {}
+        for imp in self.imports:
+            if "." in imp:
+                package, type_name = imp.rsplit(".", 1)
+                self.import_map.setdefault(sys.intern(type_name), sys.intern(package))
         self.classes: List[JavaClass] = [
             JavaClass(body, self, min_body_len=min_body_len)
             for body in compilation_unit.types
         ]
         for cls in self.classes:
-            self.project.user_types.update(
-                {JavaType(cls.name, self.package, self.project): []}
-            )
+            user_type = JavaType.get(cls.name, self.package, self.project)
+            self.project.user_types.update({user_type: []})
+            self.project.user_type_index.setdefault((self.package, cls.name), user_type)
 
     def get_type(self, type_name: str) -> JavaType:
         """Get `JavaType` object from its string identifier."""
+        java_type = self._type_cache.get(type_name)
+        if java_type is None:
+            java_type = self._resolve_type(type_name)
+            self._type_cache.update({type_name: java_type})
+        return java_type
+
+    def _resolve_type(self, type_name: str) -> JavaType:
+        """Look up the type in the file's package, imports and the project."""
         if not type_name:
-            return JavaType(None, None, self.project)
+            return JavaType.get(None, None, self.project)
         ans = self.project.get_user_type(self.package, type_name)
         if ans is not None:
             return ans
-        for imp in self.imports:
-            if re.match(rf"^.*\.{type_name}$", imp) is not None:
-                ans = self.project.get_user_type(
-                    imp.replace(f".{type_name}", ""), type_name
-                )
-                if ans is not None:
-                    return ans
-                return JavaType(
-                    type_name, imp.replace(f".{type_name}", ""), self.project
-                )
-        for wildcard_import in self.wildcard_imports:
-            ans = self.project.get_user_type(wildcard_import, type_name)
+        package = self.import_map.get(type_name)
+        if package is not None:
+            ans = self.project.get_user_type(package, type_name)
             if ans is not None:
                 return ans
-        return JavaType(type_name, "", self.project)
+            return JavaType.get(type_name, package, self.project)
+        package = self.wildcard_import_map.get(type_name)
+        if package is not None:
+            ans = self.project.get_user_type(package, type_name)
+            if ans is not None:
+                return ans
+        return JavaType.get(type_name, "", self.project)
 
     def compare(self, other: JavaFile, fast_scan: bool = False) -> Report:
         report = self.compare_parts(other, "classes", fast_scan)
@@ -469,10 +659,38 @@ class JavaProject(AbstractProject):
     def size(self) -> int:
         return len(self.java_files)
 
+    def clear_comparison_caches(self):
+        self.comparisons.clear()
+        for method in self.methods:
+            for block in method.statement_blocks:
+                block.clear_comparison_cache()
+
+    def cached_comparison(
+        self,
+        first: ComparableEntity,
+        second: ComparableEntity,
+        fast_scan: bool,
+        compute: Callable[[], Report],
+    ) -> Report:
+        """Return the memoized report of `first` and `second`, `compute` it on first use."""
+        # Cached reports reference both entities, so the ids stay unique.
+        key = (id(first), id(second), fast_scan)
+        report = self.comparisons.get(key)
+        if report is None:
+            report = compute()
+            self.comparisons[key] = report
+        return report
+
     def __init__(
-        self, path: Union[str, pathlib.Path], template: bool, *, min_body_len=0
+        self,
+        path: Union[str, pathlib.Path],
+        template: bool,
+        *,
+        min_body_len=0,
+        ast_cache_dir: Optional[pathlib.Path] = None,
     ):
-        """Parameter `path` is path to the project's root directory."""
+        """Parameter `path` is path to the project's root directory,
+        `ast_cache_dir` is an optional directory where parsed ASTs are cached between runs."""
         super().__init__("Java", template)
         self.path: pathlib.Path
         if not isinstance(path, pathlib.Path):
@@ -483,44 +701,64 @@ class JavaProject(AbstractProject):
             raise ValueError(f"Given path does not exist: {path}")
         self.name = self.path.name
         self.visualise = True
-        self.root_path = get_user_project_root(self.path)
         self.user_types: Dict[JavaType, List[JavaType]] = {}
+        self.user_type_index: Dict[Tuple[str, str], JavaType] = {}
+        self.type_pool: Dict[Tuple[Optional[str], Optional[str]], JavaType] = {}
+        # Memoized reports keyed by ids of the compared entities and the scan mode.
+        self.comparisons: Dict[Tuple[int, int, bool], Report] = {}
         self.java_files: List[JavaFile] = []
         java_files = get_java_files(self.path)
-        for file in java_files:
+        compilation_units = [get_java_ast(file, ast_cache_dir) for file in java_files]
+        for file, compilation_unit in zip(java_files, compilation_units):
+            if not compilation_unit:
+                continue
             try:
-                self.java_files.append(JavaFile(file, self, min_body_len=min_body_len))
+                self.java_files.append(
+                    JavaFile(
+                        file,
+                        self,
+                        min_body_len=min_body_len,
+                        compilation_unit=compilation_unit,
+                    )
+                )
             except ValueError:
                 continue
+        self.files_by_package: Dict[str, List[JavaFile]] = {}
+        for file in self.java_files:
+            self.files_by_package.setdefault(file.package, []).append(file)
         for file in self.java_files:
             for w_import in file.wildcard_imports:
                 file.import_types.extend(
                     f.name_without_appendix for f in self.get_files_in_package(w_import)
                 )
+                # The first wildcard import providing a class name wins.
+                for cls in self.get_classes_in_package(w_import):
+                    file.wildcard_import_map.setdefault(cls.name, w_import)
         for t in self.user_types.keys():
             type_class = self.get_class(t.package, t.name)
             if type_class:
                 self.user_types.update({t: type_class.get_non_user_defined_types()})
+        self._resolve_references()
+
+    def _resolve_references(self):
+        """Resolve invoked methods of all methods once, instead of in each worker process."""
+        for method in self.methods:
+            method.resolve_invocations()
 
     def get_file(self, package: str, class_name: str) -> Optional[JavaFile]:
         """Returns `JavaFile` object filtered by package and class name."""
-        files = list(
-            filter(
-                lambda x: True
-                if x.name_without_appendix == class_name and x.package == package
-                else False,
-                self.java_files,
-            )
-        )
+        files = [
+            f
+            for f in self.get_files_in_package(package)
+            if f.name_without_appendix == class_name
+        ]
         if len(files) == 1:
             return files[0]
         return None
 
     def get_files_in_package(self, package: str) -> List[JavaFile]:
         """Returns all `JavaFile` instances in a package."""
-        return list(
-            filter(lambda x: True if x.package == package else False, self.java_files)
-        )
+        return self.files_by_package.get(package, [])
 
     def get_classes_in_package(self, package: str) -> List[JavaClass]:
         """Returns all `JavaClass` instances in a package."""
@@ -533,18 +771,11 @@ class JavaProject(AbstractProject):
         """Return `JavaClass` object filtered by package and name."""
         if package.startswith("$"):
             package = package[1:]
-        found_classes = list(
-            filter(lambda x: True if x.name == class_name else False, self.classes)
-        )
+        found_classes = self.classes_by_name.get(class_name, [])
         if len(found_classes) == 1:
             return found_classes[0]
         if len(found_classes) > 1:
-            found_classes = list(
-                filter(
-                    lambda x: True if x.java_file.package == package else False,
-                    found_classes,
-                )
-            )
+            found_classes = [c for c in found_classes if c.java_file.package == package]
         if len(found_classes) == 1:
             return found_classes[0]
         print(
@@ -554,17 +785,12 @@ class JavaProject(AbstractProject):
 
     def get_user_type(self, package: str, class_name: str) -> Optional[JavaType]:
         """Return user-defined `JavaType` filtered by package and class name."""
-        types = list(
-            filter(
-                lambda x: True
-                if x.package == package and x.name == class_name
-                else False,
-                self.user_types.keys(),
-            )
-        )
-        if len(types) == 1:
-            return types[0]
-        return None
+        return self.user_type_index.get((package, class_name))
+
+    @cached_property
+    def root_path(self) -> pathlib.Path:
+        """Root of the project's source files, searched for only when needed."""
+        return get_user_project_root(self.path)
 
     @cached_property
     def classes(self):
@@ -574,6 +800,22 @@ class JavaProject(AbstractProject):
             ans.extend(file.classes)
         return ans
 
+    @cached_property
+    def classes_by_name(self) -> Dict[str, List[JavaClass]]:
+        """All classes in project grouped by their names."""
+        ans = {}
+        for cl in self.classes:
+            ans.setdefault(cl.name, []).append(cl)
+        return ans
+
+    @cached_property
+    def classes_by_package_and_name(self) -> Dict[Tuple[str, str], List[JavaClass]]:
+        """All classes in project grouped by their packages and names."""
+        ans = {}
+        for cl in self.classes:
+            ans.setdefault((cl.java_file.package, cl.name), []).append(cl)
+        return ans
+
     @cached_property
     def methods(self):
         """All methods in project."""
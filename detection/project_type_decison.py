@@ -11,19 +11,24 @@ file_type_dict = {".java": JavaProject, ".py": PythonProject}
 def determine_type_of_project(project_dir: Union[str, Path]) -> Optional[Type]:
     if not isinstance(project_dir, Path):
         project_dir = Path(project_dir)
-    answers = dict()
-    for extension in file_type_dict.keys():
-        num_of_files = len(list(project_dir.glob(f"**/*{extension}")))
-        if num_of_files > 0:
-            answers.update({extension: num_of_files})
+    counts = dict.fromkeys(file_type_dict.keys(), 0)
+    for file in project_dir.glob("**/*"):
+        if file.suffix in counts:
+            counts[file.suffix] += 1
+    answers = {extension: num for extension, num in counts.items() if num > 0}
     if not answers:
         return
     return file_type_dict[max(answers, key=lambda x: answers[x])]
 
 
 def create_project(
-    directory: Union[str, Path], template: bool, min_body_len
+    directory: Union[str, Path],
+    template: bool,
+    min_body_len,
+    ast_cache_dir: Optional[Path] = None,
 ) -> Optional[AbstractProject]:
     proj_type = determine_type_of_project(directory)
     if proj_type:
-        return proj_type(directory, template, min_body_len=min_body_len)
+        return proj_type(
+            directory, template, min_body_len=min_body_len, ast_cache_dir=ast_cache_dir
+        )
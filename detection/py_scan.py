@@ -6,7 +6,11 @@ from typing import Union, List, Optional
 from functools import cached_property
 
 from detection.thresholds import method_interface_threshold
-import detection.utils as utils
+from detection.utils import (
+    calculate_score_based_on_numbers,
+    get_python_ast,
+    get_python_files,
+)
 from detection.abstract_scan import (
     Report,
     ComparableEntity,
@@ -67,19 +71,19 @@ class PythonFunction(ComparableEntity):
             100 if self.has_kwarg == other.has_kwarg else 0, 5, self, other
         )
         report += Report(
-            utils.calculate_score_based_on_numbers(self.args, other.args),
+            calculate_score_based_on_numbers(self.args, other.args),
             5,
             self,
             other,
         )
         report += Report(
-            utils.calculate_score_based_on_numbers(self.positionals, other.positionals),
+            calculate_score_based_on_numbers(self.positionals, other.positionals),
             5,
             self,
             other,
         )
         report += Report(
-            utils.calculate_score_based_on_numbers(self.kwonlyargs, other.kwonlyargs),
+            calculate_score_based_on_numbers(self.kwonlyargs, other.kwonlyargs),
             5,
             self,
             other,
@@ -97,16 +101,11 @@ class PythonStatementBlock(AbstractStatementBlock):
         statement: ast.stmt,
         parent: Union[PythonFile, PythonClass, PythonFunction],
     ):
-        super().__init__(statement, ast.AST)
+        super().__init__(statement, ast.AST, {ast.Call})
         self.name = "Statement"
         self.invoked_methods: List[PythonFunctionInvocation] = [
             PythonFunctionInvocation(s, self)
-            for s in self._search_for_types(
-                statement,
-                {
-                    ast.Call,
-                },
-            ).get(ast.Call, [])
+            for s in self.searched_nodes.get(ast.Call, [])
         ]
         self.parent = parent
         self.parent_file = (
@@ -233,7 +232,7 @@ class PythonFile(ComparableEntity):
         self.name_without_appendix = self.name.split(".")[0]
         self.project = project
         self.imports: List[PythonImport] = []
-        _ast = utils.get_python_ast(self.path)
+        _ast = get_python_ast(self.path)
         _body = [] if not _ast else _ast.body
         for i in _body:
             if not (isinstance(i, ast.Import) or isinstance(i, ast.ImportFrom)):
@@ -268,12 +267,8 @@ class PythonFile(ComparableEntity):
         `qualifier` is the dotted identifier before the function or method (`re` in `re.match()`)
         """
         if not qualifier:
-            ans = list(
-                filter(
-                    lambda x: True if function_name == x.name else False, self.functions
-                )
-            )
-            if len(ans) > 0:
+            ans = [f for f in self.functions if f.name == function_name]
+            if ans:
                 return ans[-1]
             for imp in self.imports:
                 if function_name in imp.imported_objects_str:
@@ -292,10 +287,8 @@ class PythonFile(ComparableEntity):
         for cl in self.classes:
             # This is not 100 % accurate, method from first found class will be returned,
             # which might not match the actual object type
-            ans = list(
-                filter(lambda x: True if function_name == x.name else False, cl.methods)
-            )
-            if len(ans) > 0:
+            ans = [m for m in cl.methods if m.name == function_name]
+            if ans:
                 return ans[-1]
         return None
 
@@ -318,10 +311,16 @@ class PythonProject(AbstractProject):
     """Class representing the Python Projects."""
 
     def __init__(
-        self, path: Union[str, pathlib.Path], template: bool, *, min_body_len=0
+        self,
+        path: Union[str, pathlib.Path],
+        template: bool,
+        *,
+        min_body_len=0,
+        ast_cache_dir: Optional[pathlib.Path] = None,
     ):
         """Parameter `path` requires the root directory of the project,
         `template` is a boolean value stating whether the project should be categorized as a template.
+        Python files are parsed fast enough, `ast_cache_dir` is accepted for the common interface only.
         """
         super().__init__("Python", template)
         self.path: pathlib.Path
@@ -335,7 +334,7 @@ class PythonProject(AbstractProject):
         self.visualise = True
         self.python_files: List[PythonFile] = [
             PythonFile(p, self, min_body_len=min_body_len)
-            for p in utils.get_python_files(self.path)
+            for p in get_python_files(self.path)
         ]
         self.__all_statements = []
         for p_file in self.python_files:
@@ -350,17 +349,14 @@ class PythonProject(AbstractProject):
     def get_module(self, identifier: str) -> Optional[PythonFile]:
         """Search for a PythonFile object from imports."""
         identifier_list = [i for i in identifier.split(".") if i]
-        all_found_files = list(
-            filter(
-                lambda x: True
-                if x.name_without_appendix == identifier_list[-1]
-                else False,
-                self.python_files,
-            )
-        )
+        all_found_files = [
+            f
+            for f in self.python_files
+            if f.name_without_appendix == identifier_list[-1]
+        ]
         if len(all_found_files) == 1:
             return all_found_files[0]
-        elif len(all_found_files) < 1 or len(identifier_list) <= 1:
+        elif not all_found_files or len(identifier_list) <= 1:
             return None
         filtered_files = []
         for f in all_found_files:
@@ -381,6 +377,10 @@ class PythonProject(AbstractProject):
     def size(self) -> int:
         return len(self.python_files)
 
+    def clear_comparison_caches(self):
+        for statement_block in self.__all_statements:
+            statement_block.clear_comparison_cache()
+
     def compare(
         self, other: AbstractProject, fast_scan: bool = False
     ) -> Optional[Report]:
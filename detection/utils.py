@@ -1,24 +1,29 @@
 import ast
+import hashlib
+import os
 import pathlib
+import pickle
+from contextlib import suppress
+from math import sqrt
 from pathlib import Path
-from typing import List, Union
+from typing import List, Optional, Union
 
 import javalang
 from javalang import tree
 
+from detection.thresholds import skip_attr_list_threshold
+
 
 def get_java_files(project_dir: Union[str, Path]) -> List[Path]:
     """Return all suitable files that contain the `.java` extension."""
-    return [
-        f for f in list(project_dir.glob("**/*.java")) if f.name != "module-info.java"
-    ]
+    return [f for f in project_dir.glob("**/*.java") if f.name != "module-info.java"]
 
 
 def get_python_files(project_dir: Union[str, Path]) -> List[Path]:
     """Return all suitable files that contain the `.py` extension."""
     return [
         f
-        for f in list(project_dir.glob("**/*.py"))
+        for f in project_dir.glob("**/*.py")
         if f.name != "__init__.py" and "__pycache__" not in str(f.absolute())
     ]
 
@@ -29,27 +34,75 @@ def get_user_project_root(project_dir: Union[str, Path]) -> Path:
         project_dir = Path(project_dir)
     root_paths = list(project_dir.glob("**/src/main/java"))
     root_paths.sort(key=lambda x: len(x.parts))
-    if len(root_paths) < 1:
+    if not root_paths:
         return project_dir
     return root_paths[0]
 
 
-def get_java_ast(java_file: Union[str, Path]) -> javalang.tree.CompilationUnit:
-    """Return AST of the java file."""
-    with open(java_file, "r") as inp_file:
-        lines = "".join(inp_file.readlines())
+# Trees pickled by other javalang versions or cache layouts are not reused.
+_ast_cache_format = 1
+_ast_cache_subdir = f"javalang-{javalang.__version__}-{_ast_cache_format}"
+
+
+def get_java_ast(
+    java_file: Union[str, Path], cache_dir: Optional[Path] = None
+) -> javalang.tree.CompilationUnit:
+    """Return AST of the java file, cached in `cache_dir` if it is given."""
+    lines = Path(java_file).read_text()
+    cache_file = None
+    if cache_dir is not None:
+        cache_file = (
+            Path(cache_dir)
+            / _ast_cache_subdir
+            / f"{hashlib.sha1(lines.encode()).hexdigest()}.pickle"
+        )
+        compilation_unit = _load_from_cache(cache_file)
+        if compilation_unit is not None:
+            return compilation_unit
     try:
-        return javalang.parse.parse(lines)
+        compilation_unit = javalang.parse.parse(lines)
     except Exception as e:
         print(
             f"ERROR: Problem encountered while parsing file {java_file}. Problem type: {type(e).__name__}."
         )
+        return None
+    if cache_file is not None:
+        _store_in_cache(cache_file, compilation_unit)
+    return compilation_unit
+
+
+def _load_from_cache(cache_file: Path):
+    """Return the object pickled in `cache_file` or `None`, unreadable files are removed."""
+    try:
+        with open(cache_file, "rb") as f:
+            return pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception:
+        with suppress(OSError):
+            cache_file.unlink(missing_ok=True)
+        return None
+
+
+def _store_in_cache(cache_file: Path, obj):
+    """Pickle `obj` to `cache_file`. The file is replaced atomically, so that parallel workers
+    never read a partially written file."""
+    tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_file, "wb") as f:
+            pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+    except (OSError, pickle.PicklingError) as e:
+        tmp_file.unlink(missing_ok=True)
+        print(
+            f"WARNING: Cannot write parsed file to cache {cache_file}. Problem type: {type(e).__name__}."
+        )
 
 
 def get_python_ast(python_file: Union[str, Path]) -> ast.Module:
     """Return AST of the Python file."""
-    with open(python_file, "r") as inp_file:
-        lines = "".join(inp_file.readlines())
+    lines = Path(python_file).read_text()
     try:
         return ast.parse(lines)
     except Exception as e:
@@ -66,6 +119,23 @@ def calculate_score_based_on_numbers(first: int, second: int) -> int:
     return int(100 - 100 * (abs(first - second) / (first + second)))
 
 
+def lengths_too_different(first: int, second: int) -> bool:
+    """Decide whether lists of these lengths are too different to be compared in fast scan mode."""
+    return 1 - sqrt(abs(first - second) / (first + second)) < skip_attr_list_threshold
+
+
+def calculate_score_of_exact_matches(matches: int, mismatches: int) -> int:
+    """Score of `matches` full-score and `mismatches` zero-score reports of equal weight added up."""
+    if not matches:
+        return 0
+    probability = 100
+    weight = matches
+    for _ in range(mismatches):
+        probability = probability * weight // (weight + 1)
+        weight += 1
+    return probability
+
+
 def parse_projects_file(path: Union[pathlib.Path]) -> dict:
     """Read a file containing the list of projects to clone and compare.
     Outputs a dictionary containing url to clone from and the name for the project."""
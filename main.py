@@ -8,6 +8,7 @@ from detection.definitions import (
     project_regex as default_regex,
     default_output_file_name,
     cpu_count as default_cpu_count,
+    java_ast_cache_dir as default_ast_cache_dir,
 )
 from detection.compare import print_path, create_excel
 from detection.project_type_decison import determine_type_of_project
@@ -72,8 +73,12 @@ def main(args: argparse.Namespace):
         return
     print("INFO: Loading projects to memory...")
     min_body_len = 2 if args.skip_setters_getters else 0
+    ast_cache_dir = Path(args.ast_cache) if args.ast_cache else None
     projects = parallel_initialize_projects(
-        projects_dir_path, cpu_count=args.cpu, min_body_len=min_body_len
+        projects_dir_path,
+        cpu_count=args.cpu,
+        min_body_len=min_body_len,
+        ast_cache_dir=ast_cache_dir,
     )
     project_names = set(p.name for p in projects)
     projects.extend(
@@ -83,6 +88,7 @@ def main(args: argparse.Namespace):
             skip_names=project_names,
             cpu_count=args.cpu,
             min_body_len=min_body_len,
+            ast_cache_dir=ast_cache_dir,
         )
     )
     after_parsing = datetime.datetime.now()
@@ -102,11 +108,7 @@ def main(args: argparse.Namespace):
             )
             print(print_path(report))
     empty_projects = [
-        p.name
-        for p in filter(
-            lambda x: True if not determine_type_of_project(x) else False,
-            projects_dir_path.iterdir(),
-        )
+        p.name for p in projects_dir_path.iterdir() if not determine_type_of_project(p)
     ]
 
     if reports:
@@ -205,6 +207,14 @@ if __name__ == "__main__":
         default=default_cpu_count,
         help=f"Number of CPU cores. Defaults to {default_cpu_count} (Number of cores - 1).",
     )
+    parser.add_argument(
+        "-ac",
+        "--ast-cache",
+        nargs="?",
+        const=default_ast_cache_dir,
+        default=None,
+        help=f"Cache parsed Java files in a directory and reuse them in later runs. Defaults to {default_ast_cache_dir} if no directory is given.",
+    )
     parser.add_argument(
         "-pd",
         "--projects-directory",
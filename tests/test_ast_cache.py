@@ -0,0 +1,60 @@
+import pytest
+
+javalang = pytest.importorskip("javalang")
+
+from detection.java_scan import JavaProject
+
+
+def _write_project(root, classes):
+    root.mkdir()
+    for name, body in classes.items():
+        (root / f"{name}.java").write_text(f"package pkg;\n\npublic class {name} {body}\n")
+    return root
+
+
+@pytest.fixture
+def projects(tmp_path):
+    first = _write_project(
+        tmp_path / "first",
+        {
+            "A": "{ int x; String s; int get() { return x + 1; } }",
+            "B": "{ A a; void run() { a.get(); } }",
+        },
+    )
+    second = _write_project(
+        tmp_path / "second",
+        {
+            "A": "{ long x; String s; long get() { return x * 2; } }",
+            "C": "{ double d; }",
+        },
+    )
+    return first, second
+
+
+def _scores(first, second, cache_dir=None):
+    report = JavaProject(first, False, ast_cache_dir=cache_dir).compare(
+        JavaProject(second, False, ast_cache_dir=cache_dir)
+    )
+    return report.probability, report.weight
+
+
+def _fail_parse(lines):
+    raise AssertionError("Cached file parsed again.")
+
+
+def test_cached_asts_are_reused(projects, tmp_path, monkeypatch):
+    cache_dir = tmp_path / "cache"
+    expected = _scores(*projects)
+    assert _scores(*projects, cache_dir=cache_dir) == expected
+    assert len(list(cache_dir.glob("**/*.pickle"))) == 4
+    monkeypatch.setattr(javalang.parse, "parse", _fail_parse)
+    assert _scores(*projects, cache_dir=cache_dir) == expected
+
+
+def test_corrupted_cache_file_is_parsed_again(projects, tmp_path):
+    cache_dir = tmp_path / "cache"
+    expected = _scores(*projects, cache_dir=cache_dir)
+    corrupted = next(cache_dir.glob("**/*.pickle"))
+    corrupted.write_bytes(b"not a pickle")
+    assert _scores(*projects, cache_dir=cache_dir) == expected
+    assert corrupted.read_bytes() != b"not a pickle"
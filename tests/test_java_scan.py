@@ -0,0 +1,31 @@
+import pytest
+
+pytest.importorskip("javalang")
+
+from detection.java_scan import JavaProject
+
+
+def _write_project(root, classes):
+    root.mkdir()
+    for name, body in classes.items():
+        (root / f"{name}.java").write_text(f"package pkg;\n\npublic class {name} {body}\n")
+    return JavaProject(root, False)
+
+
+def test_cyclic_user_types_in_fast_scan(tmp_path):
+    holder = "{ A field; }"
+    first = _write_project(
+        tmp_path / "first",
+        {"A": "{ int x; B b; }", "B": "{ A a; String s; }", "Holder": holder},
+    )
+    second = _write_project(
+        tmp_path / "second",
+        {"A": "{ int x; String s; }", "C": "{ double d; }", "Holder": holder},
+    )
+    first_type = first.user_type_index[("pkg", "A")]
+    second_type = second.user_type_index[("pkg", "A")]
+    # Parts of the cyclic type are listed repeatedly, the fast scan skips the lists of different lengths.
+    report = first_type.compare(second_type, fast_scan=True)
+    assert (report.probability, report.weight) == (0, 10)
+    report = first_type.compare(second_type, fast_scan=False)
+    assert report.probability == 100